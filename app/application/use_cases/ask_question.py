@@ -12,8 +12,14 @@ class AskQuestionUseCase:
         dataset = self.repo.get(session_id)
         if not dataset:
             raise NoDatasetError("Please upload a table first.")
-        runner = PandasAgentRunner(dataset.tables)
-        answer, code_blocks, reasoning, cols, rows = await runner.ask(question)
+        runner = PandasAgentRunner(
+            dataset.tables,
+            schema=dataset.schema,
+            cache=dataset.cache,
+            lazy_tables=dataset.lazy_tables,
+            stats=dataset.stats,
+        )
+        answer, code_blocks, reasoning, cols, rows = await dataset.batcher.ask(runner, question)
         aa = to_agent_answer(answer, code_blocks, reasoning, cols, rows)
         return {
             "answer": aa.answer,
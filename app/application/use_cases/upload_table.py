@@ -1,23 +1,80 @@
 from __future__ import annotations
 from typing import Dict, List
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from ...infrastructure.data.dataset_repo import Dataset, InMemoryDatasetRepository
+from ...infrastructure.data.frames import preview_records
+from ...infrastructure.llm.langchain_agent import build_schema, build_lazy_tables, build_column_stats
 from ...domain.models import TableMeta, ColumnMeta
 from ...infrastructure.settings import settings
 
+def _read_csv_arrow(file_path: str) -> pd.DataFrame:
+    """
+    Arrow CSV reader, except that date/time columns keep their text as written,
+    as with the default parser (generated code compares them with strings).
+    """
+    df = pd.read_csv(file_path, engine="pyarrow", dtype_backend="pyarrow")
+    temporal = [c for c, t in df.dtypes.items() if isinstance(t, pd.ArrowDtype) and pa.types.is_temporal(t.pyarrow_dtype)]
+    if temporal:
+        text = pa_csv.read_csv(file_path, convert_options=pa_csv.ConvertOptions(
+            include_columns=temporal,
+            column_types=dict.fromkeys(temporal, pa.string()),
+            strings_can_be_null=True,
+        ))
+        for c in temporal:
+            df[c] = pd.Series(text.column(c), dtype=pd.ArrowDtype(pa.string()), index=df.index)
+    return df
+
+def _nulls_to_float(df: pd.DataFrame) -> pd.DataFrame:
+    """All-empty columns load as Arrow `null`, which rejects fillna(...); make them float NaN as before."""
+    for c, t in df.dtypes.items():
+        if isinstance(t, pd.ArrowDtype) and pa.types.is_null(t.pyarrow_dtype):
+            df[c] = df[c].astype("float64")
+    return df
+
 def infer_tables_from_file(file_path: str) -> Dict[str, pd.DataFrame]:
     if file_path.lower().endswith(('.xlsx', '.xls')):
-        xls = pd.ExcelFile(file_path)
-        return { (sheet or 'sheet').replace(' ', '_'): xls.parse(sheet) for sheet in xls.sheet_names }
+        # NumPy dtypes for workbooks: mixed-type columns stay object and dates datetime64
+        # (the Arrow backend rejects the former and turns the latter into Arrow timestamps).
+        with pd.ExcelFile(file_path, engine="calamine") as xls:
+            return { (sheet or 'sheet').replace(' ', '_'): xls.parse(sheet) for sheet in xls.sheet_names }
     else:
-        df = pd.read_csv(file_path)
-        return { 'data': df }
+        # Arrow-backed columns: multithreaded parsing and compact string storage.
+        try:
+            df = _read_csv_arrow(file_path)
+        except (ImportError, KeyError, ValueError):
+            # inputs the Arrow reader rejects: retry with the default parser
+            df = pd.read_csv(file_path, dtype_backend="pyarrow")
+        return { 'data': _nulls_to_float(df) }
+
+def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Text columns: categorical when low-cardinality in a table of at least
+    settings.categorical_min_rows rows, Arrow strings otherwise
+    (object columns holding mixed values are left alone).
+    """
+    n = len(df)
+    categorize = n >= settings.categorical_min_rows
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if not pd.api.types.is_string_dtype(col.dtype):
+            continue
+        nunique = col.nunique(dropna=True) if categorize else 0
+        if nunique and nunique / n < settings.categorical_max_ratio:
+            df.isetitem(i, col.astype("category"))
+        elif col.dtype == object:
+            try:
+                df.isetitem(i, col.astype(pd.ArrowDtype(pa.string())))
+            except (TypeError, ValueError):
+                pass
+    return df
 
 def build_table_meta(df_map: Dict[str, pd.DataFrame]) -> List[TableMeta]:
     metas: List[TableMeta] = []
     for name, df in df_map.items():
-        cols = [ColumnMeta(c, str(df[c].dtype)) for c in df.columns]
-        preview = df.head(settings.max_preview_rows).fillna("null").to_dict(orient="records")
+        cols = [ColumnMeta(c, t) for c, t in df.dtypes.astype(str).items()]
+        preview = preview_records(df, settings.max_preview_rows)
         metas.append(TableMeta(name=name, columns=cols, preview=preview))
     return metas
 
@@ -32,5 +89,11 @@ class UploadTableUseCase:
         for name, df in tables.items():
             if df.empty:
                 raise ValueError(f"Sheet/Table '{name}' is empty.")
-        self.repo.save(session_id, Dataset(tables=tables))
+        tables = {name: optimize_dtypes(df) for name, df in tables.items()}
+        self.repo.save(session_id, Dataset(
+            tables=tables,
+            schema=build_schema(tables),
+            lazy_tables=build_lazy_tables(tables),
+            stats=build_column_stats(tables),
+        ))
         return build_table_meta(tables)
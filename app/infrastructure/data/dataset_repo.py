@@ -1,21 +1,58 @@
 from __future__ import annotations
-from typing import Dict
-from dataclasses import dataclass
+import logging
+from typing import Any, Dict
+from dataclasses import dataclass, field
 import pandas as pd
+from cachetools import TTLCache
 
-@dataclass
+from ..llm.semantic_cache import SemanticCache
+from ..llm.question_batcher import QuestionBatcher
+from ..settings import settings
+
+logger = logging.getLogger("ai-df-chat.datasets")
+
+@dataclass(slots=True)
 class Dataset:
     tables: Dict[str, pd.DataFrame]    # table_name -> df
+    schema: str = ""                   # LLM schema prompt, built once at upload
+    cache: SemanticCache = field(default_factory=SemanticCache)   # per-session answer cache
+    lazy_tables: Dict[str, Any] = field(default_factory=dict)     # table_name -> polars LazyFrame (large datasets only)
+    stats: Dict[str, Dict[str, Dict[str, float]]] = field(default_factory=dict)   # table -> numeric column -> sum/mean/std
+    batcher: QuestionBatcher = field(default_factory=QuestionBatcher)             # coalesces this session's bursts of questions
+
+
+class _SessionCache(TTLCache):
+    """TTLCache that logs sessions dropped for size (popitem) or idleness (expire)."""
+
+    def popitem(self):
+        key, value = super().popitem()
+        logger.info(f"Evicted dataset for session {key} (max_sessions={self.maxsize}).")
+        return key, value
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for key, _ in expired:
+            logger.info(f"Expired dataset for session {key} (idle > {self.ttl}s).")
+        return expired
+
 
 class InMemoryDatasetRepository:
+    """
+    Session datasets, bounded in count (settings.max_sessions, LRU-evicted)
+    and dropped after settings.session_ttl_sec without access.
+    """
+
     def __init__(self):
-        self._store: Dict[str, Dataset] = {}
+        self._store: TTLCache = _SessionCache(maxsize=settings.max_sessions, ttl=settings.session_ttl_sec)
 
     def save(self, session_id: str, dataset: Dataset) -> None:
         self._store[session_id] = dataset
 
     def get(self, session_id: str) -> Dataset | None:
-        return self._store.get(session_id)
+        dataset = self._store.get(session_id)
+        if dataset is not None:
+            self._store[session_id] = dataset   # re-insert: TTL counts from last access
+        return dataset
 
     def clear(self, session_id: str) -> None:
         self._store.pop(session_id, None)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from typing import Any, Dict, List
+import pandas as pd
+
+NULL = "null"
+
+
+def _is_missing(v: Any) -> bool:
+    return v is None or v is pd.NA or v is pd.NaT or (isinstance(v, float) and v != v)
+
+
+def preview_records(df: pd.DataFrame, n: int) -> List[Dict[str, Any]]:
+    """
+    First `n` rows as JSON-ready records, missing values rendered as "null".
+    Same output as `df.head(n).fillna("null").to_dict(orient="records")`, built from
+    one `tolist()` per column instead of copying the frame and boxing cell by cell.
+    """
+    sub = df.head(n)
+    cols = list(sub.columns)
+    values = [[NULL if _is_missing(v) else v for v in col.tolist()] for _, col in sub.items()]
+    return [dict(zip(cols, row)) for row in zip(*values)]
@@ -5,7 +5,8 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import make_url, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -28,6 +29,12 @@ _engine: AsyncEngine | None = None
 _SessionMaker: async_sessionmaker[AsyncSession] | None = None
 
 
+def _json_dumps(obj) -> str:
+    return orjson.dumps(
+        obj, default=str, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
 def get_engine() -> AsyncEngine:
     """
     Build a single global async engine.
@@ -35,12 +42,25 @@ def get_engine() -> AsyncEngine:
     """
     global _engine
     if _engine is None:
+        connect_args: dict = {}   # add {"ssl": True} if you need SSL
+        if make_url(settings.database_url).get_driver_name() == "asyncpg":
+            connect_args.update(
+                prepared_statement_cache_size=settings.db_statement_cache_size,  # skip re-PARSE of repeated INSERTs
+                server_settings={"jit": "off"},   # JIT only slows down short OLTP statements
+            )
         _engine = create_async_engine(
             settings.database_url,
-            pool_pre_ping=True,
+            pool_pre_ping=False,         # no SELECT 1 per checkout; probe_pool() checks idle conns instead
+            pool_reset_on_return=None,   # sessions always end their transaction before release
             pool_recycle=1800,   # recycle stale connections
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
             future=True,
-            # connect_args={}  # add {"ssl": True} if you need SSL
+            # JSONB via orjson: handles date/timestamp and numpy values, writes NaN as null
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            connect_args=connect_args,
         )
     return _engine
 
@@ -77,6 +97,22 @@ async def init_models(retries: int = 20, delay: float = 1.5) -> None:
     raise last_exc if last_exc else RuntimeError("Database initialization failed")
 
 
+async def probe_pool(interval: float | None = None) -> None:
+    """
+    Background liveness probe replacing per-checkout pre-ping: a failed probe on a dropped
+    connection makes SQLAlchemy invalidate the pool, so requests get fresh connections.
+    """
+    interval = settings.db_probe_interval_sec if interval is None else interval
+    engine = get_engine()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+        except Exception as e:
+            logger.warning(f"DB pool probe failed: {e!r}")
+
+
 async def dispose_engine() -> None:
     eng = get_engine()
     await eng.dispose()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import logging
 from typing import Any, Dict, List, Optional
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .database import get_session_maker
 from .models import ChatQA
 
+logger = logging.getLogger("ai-df-chat.db")
+
 
 class ChatLogRepository:
     def __init__(self, session: AsyncSession):
@@ -21,18 +26,31 @@ class ChatLogRepository:
         code: Optional[List[str]],
         columns: Optional[List[str]],
         rows: Optional[List[dict]],
-    ) -> ChatQA:
-        obj = ChatQA(
-            session_id=session_id,
-            model_name=model_name,
-            question=question,
-            answer=answer,
-            explanation=explanation,
-            code=code,
-            columns=columns,
-            rows=rows,
+    ) -> None:
+        # Core INSERT: nothing reads the row back, so skip the ORM unit of work and refresh().
+        await self.session.execute(
+            insert(ChatQA).values(
+                session_id=session_id,
+                model_name=model_name,
+                question=question,
+                answer=answer,
+                explanation=explanation,
+                code=code,
+                columns=columns,
+                rows=rows,
+            )
         )
-        self.session.add(obj)
         await self.session.commit()
-        await self.session.refresh(obj)
-        return obj
+
+
+async def log_chat_entry(**entry: Any) -> None:
+    """
+    Background-task entry point: writes one Q&A row in its own session,
+    after the response has been sent. Failures are logged, not raised.
+    """
+    Session = get_session_maker()
+    try:
+        async with Session() as session:
+            await ChatLogRepository(session).add_entry(**entry)
+    except Exception as e:
+        logger.warning(f"Failed to log chat entry: {e!r}")
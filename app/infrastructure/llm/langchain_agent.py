@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-import json
+import ast
+import asyncio
+import hashlib
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Tuple, Optional
 
+import orjson
 import pandas as pd
 
 from ..settings import settings
+from ..data.frames import preview_records
+from .semantic_cache import SemanticCache
 
 try:
     from langchain_openai import ChatOpenAI
 except Exception:
     ChatOpenAI = None
 
+try:
+    import polars as pl
+except Exception:
+    pl = None
+
 
 # ---------- prompting ----------
 
@@ -25,9 +36,21 @@ PLAN_SYSTEM = (
     "- Put the final value or DataFrame into a variable named `result`.\n"
     "- If the result is a scalar/Series/DataFrame, wrap it with the helper `as_df(x, name='value')` "
     "  which is available in your environment. Do NOT call `.to_frame()` yourself.\n"
+    "- Prefer vectorized pandas operations (column arithmetic, groupby/agg, merge); "
+    "  avoid Python loops, `.apply` and `.iterrows`.\n"
+    "- Columns of dtype `category` are pandas Categoricals: assigning a label they don't already hold "
+    "  and ordering comparisons (`<`, `>=`) fail, so convert them with `.astype('string')` first.\n"
     "- Do not print; no file IO; no network.\n"
 )
 
+# Appended to PLAN_SYSTEM when the dataset is large enough for the Polars path.
+POLARS_SYSTEM = (
+    "Also return key `polars_code`: equivalent Polars code for the same question.\n"
+    "- There, each DataFrame name is bound to a Polars LazyFrame and `pl` is the polars module.\n"
+    "- Build a lazy query and assign it (or a scalar) to `result`; do NOT call `.collect()`.\n"
+    "- Use ONLY `pl` and the provided LazyFrames; do NOT import anything.\n"
+)
+
 PLAN_USER_TMPL = """\
 DATAFRAMES:
 {schema}
@@ -36,39 +59,51 @@ QUESTION:
 {question}
 
 Respond ONLY with JSON like:
-{{"code": "...", "reasoning": "...", "short_answer": "..."}}
+{response_example}
+"""
+
+# Appended to the system prompt when several queued questions share one call.
+BATCH_SYSTEM = (
+    "Several questions may be asked at once: answer each one independently, "
+    "as if it had been asked alone.\n"
+)
+
+BATCH_USER_TMPL = """\
+DATAFRAMES:
+{schema}
+
+QUESTIONS (JSON array):
+{questions}
+
+Respond ONLY with a JSON array holding one object per question, in the same order, each like:
+{response_example}
 """
 
+RESPONSE_EXAMPLE = '{"code": "...", "reasoning": "...", "short_answer": "..."}'
+POLARS_RESPONSE_EXAMPLE = '{"code": "...", "polars_code": "...", "reasoning": "...", "short_answer": "..."}'
+
 def build_schema(tables: Dict[str, pd.DataFrame]) -> str:
     parts = []
     for name, df in tables.items():
-        dtypes = ", ".join([f"{c}:{str(df[c].dtype)}" for c in df.columns])
-        prev = df.head(3).fillna("null").to_dict(orient="records")
-        parts.append(f"- {name}({dtypes})\n  preview: {json.dumps(prev)[:500]}")
+        dtypes = ", ".join(f"{c}:{t}" for c, t in df.dtypes.astype(str).items())
+        prev = orjson.dumps(preview_records(df, 3), default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        parts.append(f"- {name}({dtypes})\n  preview: {prev[:500]}")
     return "\n".join(parts)
 
 
 # ---------- safety ----------
 
-BAN_PATTERNS = [
-    r"\bimport\b",
-    r"\bopen\s*\(",
-    r"\bos\b",
-    r"\bsys\b",
-    r"\bsubprocess\b",
-    r"\bshutil\b",
-    r"\bpathlib\b",
-    r"\bpickle\b",
-    r"\bjoblib\b",
-    r"\burllib\b",
-    r"\brequests\b",
-    r"\beval\s*\(",
-    r"\bexec\s*\(",
-    r"__",
-    r"\bcompile\s*\(",
-    r"\bglobals\s*\(",
-    r"\blocals\s*\(",
+BANNED_NAMES = [
+    "import", "os", "sys", "subprocess", "shutil", "pathlib",
+    "pickle", "joblib", "urllib", "requests",
 ]
+BANNED_CALLS = ["open", "eval", "exec", "compile", "globals", "locals"]
+
+# The whole denylist (`\bname\b`, `\bcall\s*\(`, `__`) as one regex with a shared `\b`
+# prefix: a single scan over the code instead of one re.search per pattern.
+_BAN_RE = re.compile(
+    rf"\b(?:(?P<name>{'|'.join(BANNED_NAMES)})\b|(?P<call>{'|'.join(BANNED_CALLS)})\s*\()|(?P<dunder>__)"
+)
 
 SAFE_BUILTINS = {
     "len": len, "range": range, "min": min, "max": max, "sum": sum,
@@ -77,10 +112,16 @@ SAFE_BUILTINS = {
 }
 
 def validate_code_safety(code: str) -> Optional[str]:
-    for pat in BAN_PATTERNS:
-        if re.search(pat, code):
-            return f"Unsafe code rejected by policy (pattern: {pat})."
-    return None
+    m = _BAN_RE.search(code)
+    if not m:
+        return None
+    if m.group("name"):
+        pat = rf"\b{m.group('name')}\b"
+    elif m.group("call"):
+        pat = rf"\b{m.group('call')}\s*\("
+    else:
+        pat = r"__"
+    return f"Unsafe code rejected by policy (pattern: {pat})."
 
 
 def as_df(x, name: str = "value") -> pd.DataFrame:
@@ -91,16 +132,80 @@ def as_df(x, name: str = "value") -> pd.DataFrame:
         return x.to_frame().T.reset_index(drop=True)
     return pd.DataFrame([{name: x}])
 
+def _to_frame(x, *args, **kwargs) -> pd.DataFrame:
+    """Target of the auto-fix: real `.to_frame(...)` where it exists, as_df(...) for scalars."""
+    if hasattr(x, "to_frame"):
+        return x.to_frame(*args, **kwargs)
+    return as_df(x, name=args[0] if args else kwargs.get("name", "value"))
+
+@lru_cache(maxsize=512)
+def _compile_code(code: str):
+    """Bytecode for a generated snippet; repeated snippets skip the parser/compiler."""
+    return compile(code, "<llm>", "exec")
+
 def execute_pandas_code(tables: Dict[str, pd.DataFrame], code: str) -> pd.DataFrame:
-    safe_globals = {"__builtins__": SAFE_BUILTINS, "pd": pd, "as_df": as_df}
-    safe_locals: Dict[str, Any] = {**tables}
-    exec(code, safe_globals, safe_locals)
-    if "result" not in safe_locals:
-        for _, v in reversed(list(safe_locals.items())):
-            if isinstance(v, (pd.DataFrame, pd.Series, int, float, str)):
-                safe_locals["result"] = v
-                break
-    res = safe_locals.get("result", None)
+    # One namespace: tables are visible inside comprehensions/lambdas of the generated code.
+    # Shallow copies (cheap under copy-on-write) keep the session's frames, and the schema,
+    # stats and lazy tables built from them, unchanged by code like `data['x'] = ...`,
+    # including when several runs share the frames from worker threads.
+    frames = {name: df.copy(deep=False) for name, df in tables.items()}
+    namespace: Dict[str, Any] = {**frames, "__builtins__": SAFE_BUILTINS, "pd": pd, "as_df": as_df, "_to_frame": _to_frame}
+    exec(_compile_code(code), namespace)
+    if "result" not in namespace:
+        raise RuntimeError("LLM code did not assign `result`.")
+    return as_df(namespace["result"])
+
+
+class _ToFrameRewriter(ast.NodeTransformer):
+    """Rewrite `x.to_frame(...)` into `_to_frame(x, ...)`, keeping the call's arguments."""
+
+    def __init__(self):
+        self.changed = False
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        self.generic_visit(node)
+        func = node.func
+        if not (isinstance(func, ast.Attribute) and func.attr == "to_frame"):
+            return node
+        self.changed = True
+        return ast.copy_location(
+            ast.Call(func=ast.Name(id="_to_frame", ctx=ast.Load()), args=[func.value, *node.args], keywords=node.keywords),
+            node,
+        )
+
+@lru_cache(maxsize=256)
+def rewrite_to_frame(code: str) -> Optional[str]:
+    """Auto-fix source for a failed run, or None if the code has no `.to_frame(...)` call to rewrite."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    rewriter = _ToFrameRewriter()
+    tree = rewriter.visit(tree)
+    if not rewriter.changed:
+        return None
+    return ast.unparse(ast.fix_missing_locations(tree))
+
+
+def build_lazy_tables(tables: Dict[str, pd.DataFrame]) -> Dict[str, Any]:
+    """Polars LazyFrames for the Polars path; empty when polars is missing, every table is small, or a table won't convert."""
+    if pl is None or all(len(df) <= settings.polars_row_threshold for df in tables.values()):
+        return {}
+    try:
+        return {name: pl.from_pandas(df).lazy() for name, df in tables.items()}
+    except Exception:
+        return {}   # e.g. object columns mixing numbers and text: pandas path only
+
+def execute_polars_code(lazy_tables: Dict[str, Any], code: str) -> pd.DataFrame:
+    namespace: Dict[str, Any] = {**lazy_tables, "__builtins__": SAFE_BUILTINS, "pl": pl}
+    exec(_compile_code(code), namespace)
+    if "result" not in namespace:
+        raise RuntimeError("Polars code did not assign `result`.")
+    res = namespace["result"]
+    if isinstance(res, pl.LazyFrame):
+        res = res.collect(engine="streaming")
+    if isinstance(res, (pl.DataFrame, pl.Series)):
+        res = res.to_pandas()
     return as_df(res)
 
 
@@ -125,106 +230,231 @@ def answer_from_dataframe(df: pd.DataFrame) -> str:
 def _has_llm() -> bool:
     return bool(ChatOpenAI and settings.openai_api_key)
 
+def _plan_from_json(data: Dict[str, Any]) -> Tuple[str, str, str]:
+    """(code, polars_code, reasoning) from one parsed LLM plan."""
+    code = str(data.get("code", "")).strip()
+    polars_code = str(data.get("polars_code", "") or "").strip()
+    reasoning = str(data.get("reasoning", "")).strip()
+    return code, polars_code, reasoning
+
+def _loads_reply(content: str) -> Any:
+    """Parse an LLM JSON reply, also accepting one wrapped in a ```json fence."""
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        m = re.search(r"```(?:json)?\s*(.*?)```", content, re.S | re.I)
+        if not m:
+            raise
+        return orjson.loads(m.group(1))
+
+def _parse_plan(content: str) -> Tuple[str, str, str]:
+    try:
+        return _plan_from_json(_loads_reply(content))
+    except Exception:
+        m = re.search(r"```(?:python)?\s*(.*?)```", content, re.S | re.I)
+        return (m.group(1) if m else "").strip(), "", "Generated from non-JSON response."
+
+
+class BatchPlanError(RuntimeError):
+    """The batched LLM call failed or returned something other than one plan per question."""
+
 class PandasAgentRunner:
     """
     LLM generates pandas code; we validate & execute in a restricted namespace.
     - Encourage using as_df(...) to avoid .to_frame() on scalars.
     - Auto-fix common mistake: `.to_frame(...)` on a scalar result.
     - Short answer is derived from the executed result (no duplicates).
+    - Generated code runs in a worker thread so heavy queries don't block the event loop.
+    - Successful answers are memoized in the optional per-session SemanticCache; on an exact
+      miss the question embedding runs alongside the LLM call.
+    - Large datasets (given `lazy_tables`): the LLM also emits Polars code, which runs first
+      on the multithreaded lazy engine; any failure falls back to the pandas code.
     """
 
-    def __init__(self, tables: Dict[str, pd.DataFrame]):
+    def __init__(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        schema: str = "",
+        cache: Optional[SemanticCache] = None,
+        lazy_tables: Optional[Dict[str, Any]] = None,
+        stats: Optional[ColumnStats] = None,
+    ):
         self.tables = tables
+        self.schema = schema   # precomputed build_schema(tables); rebuilt on demand if empty
+        self.cache = cache
+        self.lazy_tables = lazy_tables or {}
+        self.stats = stats   # precomputed build_column_stats(tables) for the rule-based fallback
+
+    def _finish(self, df: pd.DataFrame, code_blocks: List[str], expl: str, schema_hash: str, question: str, qvec) -> Tuple[str, List[str], str, List[str], List[dict]]:
+        cols, rows = list(df.columns), preview_records(df, 10)
+        out = (answer_from_dataframe(df), code_blocks, expl, cols, rows)
+        if self.cache is not None:
+            self.cache.store(schema_hash, question, out, qvec)
+        return out
+
+    def _schema(self) -> Tuple[str, str]:
+        schema = self.schema or build_schema(self.tables)
+        return schema, hashlib.sha256(schema.encode()).hexdigest()[:16]
+
+    async def _lookup(self, schema_hash: str, question: str):
+        if self.cache is None:
+            return None, None
+        return await self.cache.lookup(schema_hash, question)
+
+    async def _invoke(self, system_msg: str, user_msg: str) -> str:
+        llm = ChatOpenAI(model=settings.openai_model, temperature=0.0, api_key=settings.openai_api_key)  # type: ignore
+        resp = await llm.ainvoke([
+            {"role": "system", "content": system_msg},
+            {"role": "user", "content": user_msg},
+        ])
+        return getattr(resp, "content", "") or ""
 
     async def ask(self, question: str) -> Tuple[str, List[str], str, List[str], List[dict]]:
         if not _has_llm():
-            return rule_based_answer(self.tables, question)
-
-        llm = ChatOpenAI(model=settings.openai_model, temperature=0.0, api_key=settings.openai_api_key)  # type: ignore
-        schema = build_schema(self.tables)
-        user_msg = PLAN_USER_TMPL.format(schema=schema, question=question.strip())
-
+            return rule_based_answer(self.tables, question, self.stats)
+
+        schema, schema_hash = self._schema()
+        embedding = None
+        if self.cache is not None:
+            hit = self.cache.get(schema_hash, question)
+            if hit is not None:
+                return hit
+            embedding = asyncio.create_task(self.cache.embed(question))
+
+        system_msg = PLAN_SYSTEM + POLARS_SYSTEM if self.lazy_tables else PLAN_SYSTEM
+        example = POLARS_RESPONSE_EXAMPLE if self.lazy_tables else RESPONSE_EXAMPLE
+        user_msg = PLAN_USER_TMPL.format(schema=schema, question=question.strip(), response_example=example)
+
+        # The embedding round-trip overlaps the LLM call; a semantic hit cancels the call.
+        invoke = asyncio.create_task(self._invoke(system_msg, user_msg))
+        qvec = None
         try:
-            resp = await llm.ainvoke([
-                {"role": "system", "content": PLAN_SYSTEM},
-                {"role": "user", "content": user_msg},
-            ])
-            content = getattr(resp, "content", "") or ""
+            if embedding is not None:
+                qvec = await embedding
+                hit = self.cache.nearest(schema_hash, qvec)
+                if hit is not None:
+                    return hit
+            content = await invoke
         except Exception:
-            return rule_based_answer(self.tables, question)
+            return rule_based_answer(self.tables, question, self.stats)
+        finally:
+            invoke.cancel()   # no-op once finished
+
+        return await self._run_plan(question, _parse_plan(content), schema_hash, qvec)
+
+    async def ask_many(self, questions: List[str]) -> List[Tuple[str, List[str], str, List[str], List[dict]]]:
+        """
+        Answer several questions with one LLM call sharing the schema preamble; cache hits skip it.
+        Raises BatchPlanError (before executing anything) if the batched call fails or its
+        response doesn't hold one plan per question, so the caller can retry one by one.
+        """
+        if not _has_llm():
+            return [rule_based_answer(self.tables, q, self.stats) for q in questions]
 
-        code, reasoning, llm_short = "", "", ""
-        try:
-            data = json.loads(content)
-            code = str(data.get("code", "")).strip()
-            reasoning = str(data.get("reasoning", "")).strip()
-            llm_short = str(data.get("short_answer", "")).strip()
-        except Exception:
-            m = re.search(r"```(?:python)?\s*(.*?)```", content, re.S | re.I)
-            code = (m.group(1) if m else "").strip()
-            reasoning = "Generated from non-JSON response."
-            llm_short = ""
+        schema, schema_hash = self._schema()
+        lookups = await asyncio.gather(*(self._lookup(schema_hash, q) for q in questions))
+        results = [hit for hit, _ in lookups]
+        misses = [i for i, hit in enumerate(results) if hit is None]
+        if not misses:
+            return results
+
+        system_msg = PLAN_SYSTEM + (POLARS_SYSTEM if self.lazy_tables else "") + BATCH_SYSTEM
+        example = POLARS_RESPONSE_EXAMPLE if self.lazy_tables else RESPONSE_EXAMPLE
+        batch = orjson.dumps([questions[i].strip() for i in misses]).decode()
+        user_msg = BATCH_USER_TMPL.format(schema=schema, questions=batch, response_example=example)
 
+        try:
+            content = await asyncio.wait_for(self._invoke(system_msg, user_msg), settings.ask_batch_timeout_sec)
+            plans = _loads_reply(content)
+        except Exception as e:
+            raise BatchPlanError(f"Batched planning failed: {e!r}") from e
+        if not (isinstance(plans, list) and len(plans) == len(misses) and all(isinstance(p, dict) for p in plans)):
+            raise BatchPlanError("Batched response did not hold one plan per question.")
+
+        answers = await asyncio.gather(*(
+            self._run_plan(questions[i], _plan_from_json(plan), schema_hash, lookups[i][1])
+            for i, plan in zip(misses, plans)
+        ))
+        for i, answer in zip(misses, answers):
+            results[i] = answer
+        return results
+
+    async def _run_plan(self, question: str, plan: Tuple[str, str, str], schema_hash: str, qvec) -> Tuple[str, List[str], str, List[str], List[dict]]:
+        code, polars_code, reasoning = plan
         if not code:
-            return rule_based_answer(self.tables, question)
+            return rule_based_answer(self.tables, question, self.stats)
 
         unsafe = validate_code_safety(code)
         if unsafe:
             return ("Request blocked by safety policy.", [code], unsafe, [], [])
 
+        if self.lazy_tables and polars_code and not validate_code_safety(polars_code):
+            try:
+                df = await asyncio.to_thread(execute_polars_code, self.lazy_tables, polars_code)
+                expl = (reasoning or "Executed Polars code.") + "\n\nExecuted with the Polars lazy engine."
+                return self._finish(df, [polars_code], expl, schema_hash, question, qvec)
+            except Exception:
+                pass   # fall back to the pandas code below
+
         try:
-            df = execute_pandas_code(self.tables, code)
+            df = await asyncio.to_thread(execute_pandas_code, self.tables, code)
         except Exception as e:
-            if "to_frame" in code and "result" in code:
-                m = re.search(r"^\s*result\s*=\s*(.+)$", code, re.M | re.S)
-                if m:
-                    expr = m.group(1).strip()
-                    name_match = re.search(r"\.to_frame\s*\(\s*name\s*=\s*['\"]([^'\"]+)['\"]\s*\)", expr)
-                    col_name = name_match.group(1) if name_match else "value"
-                    expr_no_tf = re.sub(r"\.to_frame\s*\(.*?\)", "", expr)
-                    fixed_code = f"result = as_df({expr_no_tf}, name='{col_name}')"
-                    try:
-                        df = execute_pandas_code(self.tables, fixed_code)
-                        reasoning2 = (reasoning or "Executed pandas code.") + "\n\nAuto-fix: replaced `.to_frame(...)` with `as_df(...)`."
-                        preview = df.head(10).fillna("null")
-                        cols, rows = list(preview.columns), preview.to_dict(orient="records")
-                        short = answer_from_dataframe(df)
-                        return short, [code, fixed_code], reasoning2, cols, rows
-                    except Exception as e2:
-                        return ("Execution error.", [code, fixed_code], f"Exception after auto-fix: {e2}", [], [])
+            fixed_code = rewrite_to_frame(code) if "to_frame" in code else None
+            if fixed_code:
+                try:
+                    df = await asyncio.to_thread(execute_pandas_code, self.tables, fixed_code)
+                    reasoning2 = (reasoning or "Executed pandas code.") + "\n\nAuto-fix: retried with `.to_frame(...)` calls routed through `_to_frame(...)`, which wraps scalars with `as_df(...)`."
+                    return self._finish(df, [code, fixed_code], reasoning2, schema_hash, question, qvec)
+                except Exception as e2:
+                    return ("Execution error.", [code, fixed_code], f"Exception after auto-fix: {e2}", [], [])
             return ("Execution error.", [code], f"Exception: {e}", [], [])
 
-        preview = df.head(10).fillna("null")
-        cols, rows = list(preview.columns), preview.to_dict(orient="records")
-        short = answer_from_dataframe(df)
-        expl = reasoning or "Executed pandas code."
-        return short, [code], expl, cols, rows
+        return self._finish(df, [code], reasoning or "Executed pandas code.", schema_hash, question, qvec)
+
+ColumnStats = Dict[str, Dict[str, Dict[str, float]]]   # table -> column -> {"sum", "mean", "std"}
+
+def _as_float(v: Any) -> float:
+    return float("nan") if pd.isna(v) else float(v)
+
+def build_column_stats(tables: Dict[str, pd.DataFrame]) -> ColumnStats:
+    """Sum/mean/std of every numeric column, computed once at upload for rule_based_answer."""
+    return {
+        name: {
+            c: {"sum": _as_float(col.sum()), "mean": _as_float(col.mean()), "std": _as_float(col.std())}
+            for c, col in df.select_dtypes("number").items()
+        }
+        for name, df in tables.items()
+    }
+
+def _column_stat(stats: Optional[ColumnStats], name: str, df: pd.DataFrame, col: str, stat: str) -> float:
+    cached = (stats or {}).get(name, {}).get(col)
+    return cached[stat] if cached else _as_float(getattr(df[col], stat)())
 
-def rule_based_answer(tables: Dict[str, pd.DataFrame], question: str):
+def rule_based_answer(tables: Dict[str, pd.DataFrame], question: str, stats: Optional[ColumnStats] = None):
     if not tables:
         return ("Please upload a table first.", [], "No data available.", [], [])
-    name, df = list(tables.items())[0]
+    name, df = next(iter(tables.items()))
     q = question.lower()
     code_blocks: List[str] = []
 
     if any(k in q for k in ["deviation", "deviance", "diviance", "diviation", "std"]):
         col = "rating" if "rating" in df.columns else None
         if col:
-            val = float(df[col].std())
+            val = _column_stat(stats, name, df, col, "std")
             code_blocks.append(f"as_df({name}['{col}'].std(), name='{col}_std')")
             return (_format_number(val), code_blocks, f"Computed standard deviation of '{col}'.", [f"{col}_std"], [{f"{col}_std": val}])
 
     if any(k in q for k in ["total revenue", "sum revenue", "revenue total", "overall revenue"]):
         if "revenue" in df.columns:
-            val = float(df["revenue"].sum())
+            val = _column_stat(stats, name, df, "revenue", "sum")
             code_blocks.append(f"as_df({name}['revenue'].sum(), name='revenue_total')")
             return (_format_number(val), code_blocks, "Summed the revenue column.", ["revenue_total"], [{"revenue_total": val}])
 
     if any(k in q for k in ["average", "avg", "mean"]):
-        num_cols = df.select_dtypes("number").columns.tolist()
+        num_cols = list(stats[name]) if stats and name in stats else df.select_dtypes("number").columns.tolist()
         col = num_cols[0] if num_cols else None
         if col:
-            val = float(df[col].mean())
+            val = _column_stat(stats, name, df, col, "mean")
             code_blocks.append(f"as_df({name}['{col}'].mean(), name='{col}_mean')")
             return (_format_number(val), code_blocks, f"Computed mean over '{col}'.", [f"{col}_mean"], [{f"{col}_mean": val}])
 
@@ -234,5 +464,5 @@ def rule_based_answer(tables: Dict[str, pd.DataFrame], question: str):
         return (str(n), code_blocks, "Counted rows.", ["count"], [{"count": n}])
 
     code_blocks.append(f"{name}.head(5)")
-    preview = df.head(5).fillna("null").to_dict(orient="records")
+    preview = preview_records(df, 5)
     return ("Showing the first 5 rows.", code_blocks, "Previewed the first rows.", list(df.columns), preview)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+from ..settings import settings
+from .langchain_agent import BatchPlanError, PandasAgentRunner, _has_llm
+
+logger = logging.getLogger("ai-df-chat.batch")
+
+AnswerTuple = Tuple[str, List[str], str, List[str], List[dict]]
+
+
+class QuestionBatcher:
+    """
+    Per-session coalescing of questions that arrive in quick succession.
+    - The first queued question opens a short debounce window (settings.ask_batch_window_sec).
+    - When it closes, queued questions go out in groups of up to settings.ask_batch_max,
+      one LLM call per group via PandasAgentRunner.ask_many; a lone question uses ask().
+    - After the first failed batch, the session falls back to one call per question.
+    """
+
+    def __init__(self, window: float | None = None, max_batch: int | None = None):
+        self.window = settings.ask_batch_window_sec if window is None else window
+        self.max_batch = settings.ask_batch_max if max_batch is None else max_batch
+        self.enabled = self.max_batch > 1
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def ask(self, runner: PandasAgentRunner, question: str) -> AnswerTuple:
+        if not (self.enabled and _has_llm()):
+            return await runner.ask(question)
+        fut: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((question, fut))
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush(runner))
+        return await fut
+
+    async def _flush(self, runner: PandasAgentRunner) -> None:
+        await asyncio.sleep(self.window)
+        pending, self._pending, self._flusher = self._pending, [], None   # later arrivals open a new window
+        groups = [pending[i:i + self.max_batch] for i in range(0, len(pending), self.max_batch)]
+        await asyncio.gather(*(self._run(runner, group) for group in groups))
+
+    async def _run(self, runner: PandasAgentRunner, group: List[Tuple[str, asyncio.Future]]) -> None:
+        questions = [q for q, _ in group]
+        try:
+            if len(questions) == 1:
+                results = [await runner.ask(questions[0])]
+            else:
+                try:
+                    results = await runner.ask_many(questions)
+                except BatchPlanError as e:
+                    self.enabled = False
+                    logger.warning(f"Batched ask failed, switching session to single-question mode: {e}")
+                    results = await asyncio.gather(*(runner.ask(q) for q in questions))
+        except Exception as e:
+            for _, fut in group:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(group, results):
+            if not fut.done():
+                fut.set_result(result)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..settings import settings
+
+try:
+    from langchain_openai import OpenAIEmbeddings
+except Exception:
+    OpenAIEmbeddings = None
+
+logger = logging.getLogger("ai-df-chat.cache")
+
+AnswerTuple = Tuple[str, List[str], str, List[str], List[dict]]
+
+_embedder = None
+
+
+def _get_embedder():
+    global _embedder
+    if _embedder is None and OpenAIEmbeddings and settings.openai_api_key:
+        _embedder = OpenAIEmbeddings(model=settings.openai_embedding_model, api_key=settings.openai_api_key)  # type: ignore
+    return _embedder
+
+
+def normalize_question(question: str) -> str:
+    return " ".join(question.lower().split())
+
+
+class SemanticCache:
+    """
+    Per-session cache of answered questions, keyed by (schema fingerprint, question).
+    - Exact hit: sha256 of schema hash + normalized question.
+    - Semantic hit: cosine similarity of L2-normalized question embeddings >= threshold,
+      restricted to entries computed against the same schema. The returned explanation
+      names the cached question the answer was reused from.
+    - Holds at most `max_entries` of each kind; the oldest entry is evicted first.
+    """
+
+    def __init__(self, threshold: float | None = None, max_entries: int = 256):
+        self.threshold = settings.semantic_cache_threshold if threshold is None else threshold
+        self.max_entries = max_entries
+        self._exact: Dict[str, AnswerTuple] = {}
+        self._vectors: np.ndarray | None = None          # (n, dim), rows L2-normalized
+        self._entries: List[Tuple[str, str, AnswerTuple]] = []  # parallel to _vectors: (schema_hash, question, answer)
+
+    @staticmethod
+    def _exact_key(schema_hash: str, question: str) -> str:
+        return hashlib.sha256(f"{schema_hash}\n{normalize_question(question)}".encode()).hexdigest()
+
+    def get(self, schema_hash: str, question: str) -> Optional[AnswerTuple]:
+        """Exact hit only: no embedding call."""
+        return self._exact.get(self._exact_key(schema_hash, question))
+
+    async def embed(self, question: str) -> Optional[np.ndarray]:
+        embedder = _get_embedder()
+        if embedder is None:
+            return None
+        try:
+            vec = np.asarray(await embedder.aembed_query(normalize_question(question)), dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Question embedding failed: {e!r}")
+            return None
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else None
+
+    def nearest(self, schema_hash: str, vec: Optional[np.ndarray]) -> Optional[AnswerTuple]:
+        """Best semantic hit at or above the threshold for the same schema, if any."""
+        if vec is None or self._vectors is None:
+            return None
+        scores = self._vectors @ vec
+        for idx in np.argsort(scores)[::-1]:
+            if scores[idx] < self.threshold:
+                break
+            entry_schema, source, answer = self._entries[idx]
+            if entry_schema == schema_hash:
+                text, code, expl, cols, rows = answer
+                return text, code, f"{expl}\n\nReused the cached answer to a similar question: \"{source}\".", cols, rows
+        return None
+
+    async def lookup(self, schema_hash: str, question: str) -> Tuple[Optional[AnswerTuple], Optional[np.ndarray]]:
+        """Return (cached answer or None, question embedding to pass back to `store`)."""
+        hit = self.get(schema_hash, question)
+        if hit is not None:
+            return hit, None
+        vec = await self.embed(question)
+        return self.nearest(schema_hash, vec), vec
+
+    def store(self, schema_hash: str, question: str, answer: AnswerTuple, vec: Optional[np.ndarray]) -> None:
+        key = self._exact_key(schema_hash, question)
+        self._exact.pop(key, None)
+        if len(self._exact) >= self.max_entries:
+            self._exact.pop(next(iter(self._exact)))   # dicts keep insertion order: oldest first
+        self._exact[key] = answer
+        if vec is None:
+            return
+        row = vec.reshape(1, -1)
+        if self._vectors is not None and len(self._entries) >= self.max_entries:
+            self._vectors, self._entries = self._vectors[1:], self._entries[1:]
+        self._vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+        self._entries.append((schema_hash, question.strip(), answer))
@@ -5,9 +5,24 @@ class Settings(BaseSettings):
     secret_key: str
     openai_api_key: str | None
     openai_model: str 
+    openai_embedding_model: str = "text-embedding-3-small"
+    semantic_cache_threshold: float = 0.85
+    categorical_max_ratio: float = 0.5    # text columns with nunique/rows below this become categorical
+    categorical_min_rows: int = 10_000    # ...but only in tables at least this long
+    ask_batch_window_sec: float = 0.05    # debounce for coalescing a session's queued questions
+    ask_batch_max: int = 8                # questions per batched LLM call (1 disables batching)
+    ask_batch_timeout_sec: float = 30.0
+    polars_row_threshold: int = 100_000   # tables above this size also get a Polars lazy plan
     max_preview_rows: int = 5
+    max_sessions: int = 256               # uploaded datasets kept in memory at once
+    session_ttl_sec: int = 3600           # idle datasets are dropped after this long
     allow_dangerous_code: bool = True   
     database_url: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: float = 5.0
+    db_statement_cache_size: int = 256
+    db_probe_interval_sec: float = 60.0
     
     class Config:
         env_file = ".env"
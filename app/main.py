@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
 from fastapi import FastAPI
 from starlette.middleware.sessions import SessionMiddleware
@@ -8,7 +10,7 @@ from fastapi.staticfiles import StaticFiles
 from .presentation.api import router
 from .infrastructure.settings import settings
 from .infrastructure.logging_config import setup_logging
-from .infrastructure.db.database import init_models
+from .infrastructure.db.database import init_models, probe_pool, dispose_engine
 
 logger = setup_logging()
 
@@ -20,9 +22,21 @@ static_dir = "app/presentation/web/static"
 if os.path.isdir(static_dir):
     app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
+_probe_task: asyncio.Task | None = None
+
 @app.on_event("startup")
 async def _startup():
+    global _probe_task
     await init_models()
+    _probe_task = asyncio.create_task(probe_pool())
+
+@app.on_event("shutdown")
+async def _shutdown():
+    if _probe_task is not None:
+        _probe_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _probe_task
+    await dispose_engine()
 
 @app.get("/health")
 async def health():
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import datetime
 import os
 import shutil
 import tempfile
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, Request, Depends
-from fastapi.responses import HTMLResponse
+import aiofiles
+import orjson
+from fastapi import APIRouter, UploadFile, File, HTTPException, Request, BackgroundTasks
+from fastapi.responses import HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 
 from ..infrastructure.data.dataset_repo import InMemoryDatasetRepository
@@ -13,9 +16,7 @@ from ..application.use_cases.upload_table import UploadTableUseCase
 from ..application.use_cases.ask_question import AskQuestionUseCase
 from .schemas import UploadResponse, AskRequest, AskResponse
 
-from ..infrastructure.db.database import get_db
-from sqlalchemy.ext.asyncio import AsyncSession
-from ..infrastructure.db.repositories import ChatLogRepository
+from ..infrastructure.db.repositories import log_chat_entry
 from ..infrastructure.settings import settings
 
 router = APIRouter()
@@ -23,6 +24,23 @@ templates = Jinja2Templates(directory="app/presentation/web/templates")
 
 _repo = InMemoryDatasetRepository()
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # stream uploads to disk 1 MB at a time
+
+
+def _json_default(v):
+    # pd.Timestamp subclasses datetime but isn't native to orjson: ISO format, as FastAPI's encoder gave.
+    if isinstance(v, (datetime.date, datetime.time)):
+        return v.isoformat()
+    return str(v)
+
+def json_response(data) -> Response:
+    """
+    Serialize straight to bytes with orjson (dataclasses, dates, numpy scalars, NaN -> null),
+    skipping the response_model round-trip; the models still document the API.
+    """
+    body = orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return Response(content=body, media_type="application/json")
+
 
 def get_session_id(request: Request) -> str:
     sid = request.session.get("sid")
@@ -48,12 +66,13 @@ async def upload(request: Request, file: UploadFile = File(...)):
     tmpdir = tempfile.mkdtemp()
     tmpfile = os.path.join(tmpdir, f"upload{suffix}")
     try:
-        with open(tmpfile, "wb") as f:
-            f.write(await file.read())
+        async with aiofiles.open(tmpfile, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
 
         uc = UploadTableUseCase(_repo)
         metas = uc.execute(session_id, tmpfile)
-        return {"tables": [m.__dict__ for m in metas]}
+        return json_response({"tables": metas})
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
@@ -62,14 +81,15 @@ async def upload(request: Request, file: UploadFile = File(...)):
 async def ask(
     request: Request,
     payload: AskRequest,
-    db: AsyncSession = Depends(get_db), 
+    background: BackgroundTasks,
 ):
     session_id = get_session_id(request)
     uc = AskQuestionUseCase(_repo)
     try:
         data = await uc.execute(session_id, payload.question.strip())
-        repo = ChatLogRepository(db)
-        await repo.add_entry(
+        # logged after the response is sent: the DB round-trips stay off the request path
+        background.add_task(
+            log_chat_entry,
             session_id=session_id,
             model_name=settings.openai_model,
             question=payload.question.strip(),
@@ -79,6 +99,6 @@ async def ask(
             columns=data.get("columns"),
             rows=data.get("rows"),
         )
-        return data
+        return json_response(data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))